@@ -8,11 +8,31 @@ import sys
 import os
 import traceback
 import subprocess
-import importlib
-import json
+import importlib.util
 from pathlib import Path
 from typing import Optional
 
+# VENALLA_QUIET=1 silences banner/progress output for scripted relaunches;
+# failures are always printed
+_QUIET = bool(os.environ.get("VENALLA_QUIET"))
+_say = (lambda *args, **kwargs: None) if _QUIET else print
+
+# Default config.json, pre-serialized so first boot does not need the json module
+_DEFAULT_CONFIG_BYTES = (
+    b'{\n'
+    b'  "app_name": "Venalla AI Agent",\n'
+    b'  "version": "1.0.0",\n'
+    b'  "default_llm": "ollama",\n'
+    b'  "ollama_url": "http://localhost:11434",\n'
+    b'  "openai_api_key": "",\n'
+    b'  "anthropic_api_key": "",\n'
+    b'  "max_workers": 10,\n'
+    b'  "auto_update": true,\n'
+    b'  "voice_enabled": false,\n'
+    b'  "theme": "dark"\n'
+    b'}'
+)
+
 # =============================================================================
 # AUTO-ERROR RECTIFIER FOR BOOTSTRAP
 # =============================================================================
@@ -23,31 +43,55 @@ class BootstrapErrorRectifier:
     @staticmethod
     def ensure_dependencies():
         """Auto-install missing dependencies"""
-        required_packages = [
-            'PyQt6',
-            'requests',
-            'psutil',
-        ]
+        # pip package name -> top-level import name
+        required_packages = {
+            'PyQt6': 'PyQt6',
+            'requests': 'requests',
+            'psutil': 'psutil',
+        }
         
-        missing = []
-        for package in required_packages:
-            try:
-                importlib.import_module(package.lower().replace('-', '_'))
-            except ImportError:
-                missing.append(package)
+        # find_spec only locates the module; it does not execute it
+        missing = [
+            package for package, import_name in required_packages.items()
+            if importlib.util.find_spec(import_name) is None
+        ]
         
         if missing:
-            print(f"⚠️  Missing dependencies: {', '.join(missing)}")
-            print("📦 Auto-installing...")
+            _say(f"⚠️  Missing dependencies: {', '.join(missing)}")
+            _say("📦 Auto-installing...")
             
+            # Persistent wheel/HTTP cache so re-runs skip downloads
+            cache_dir = str(Path(__file__).parent / 'data' / 'pip-cache')
+            pip_env = dict(os.environ, PIP_CACHE_DIR=cache_dir)
+            pip_cmd = [
+                sys.executable, '-m', 'pip', 'install',
+                '--disable-pip-version-check', '--no-input',
+                '--cache-dir', cache_dir,
+            ]
+
+            # One pip process for everything; pip startup dominates install time
+            try:
+                subprocess.check_call(
+                    pip_cmd + missing,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=pip_env
+                )
+                _say(f"✅ Installed {', '.join(missing)}")
+                return True
+            except subprocess.CalledProcessError:
+                pass
+
+            # Batch failed - retry one by one to report the offending package
             for package in missing:
                 try:
                     subprocess.check_call(
-                        [sys.executable, '-m', 'pip', 'install', package],
+                        pip_cmd + [package],
                         stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
+                        stderr=subprocess.DEVNULL,
+                        env=pip_env
                     )
-                    print(f"✅ Installed {package}")
+                    _say(f"✅ Installed {package}")
                 except subprocess.CalledProcessError:
                     print(f"❌ Failed to install {package}")
                     return False
@@ -61,41 +105,98 @@ class BootstrapErrorRectifier:
             'core',
             'plugins',
             'data',
+            'data/pip-cache',
             'logs',
             'temp',
         ]
         
         base_path = Path(__file__).parent
         
+        # One scandir per parent instead of a stat + mkdir per directory
+        listings = {}
+        missing = []
         for directory in directories:
-            dir_path = base_path / directory
-            dir_path.mkdir(exist_ok=True)
-        
-        print("✅ Directory structure verified")
+            parent, _, name = directory.rpartition('/')
+            if parent not in listings:
+                try:
+                    with os.scandir(base_path / parent) as entries:
+                        listings[parent] = {e.name for e in entries if e.is_dir()}
+                except FileNotFoundError:
+                    listings[parent] = set()
+            if name not in listings[parent]:
+                missing.append(directory)
+
+        if not missing:
+            return
+
+        for directory in missing:
+            (base_path / directory).mkdir(parents=True, exist_ok=True)
+
+        _say("✅ Directory structure verified")
     
     @staticmethod
     def ensure_config():
         """Create default config if missing"""
         config_path = Path(__file__).parent / 'config.json'
         
-        if not config_path.exists():
-            default_config = {
-                "app_name": "Venalla AI Agent",
-                "version": "1.0.0",
-                "default_llm": "ollama",
-                "ollama_url": "http://localhost:11434",
-                "openai_api_key": "",
-                "anthropic_api_key": "",
-                "max_workers": 10,
-                "auto_update": True,
-                "voice_enabled": False,
-                "theme": "dark"
-            }
-            
-            with open(config_path, 'w') as f:
-                json.dump(default_config, f, indent=2)
-            
-            print("✅ Created default config.json")
+        # O_EXCL makes "exists?" and "create" a single race-free syscall
+        try:
+            fd = os.open(str(config_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return
+
+        try:
+            try:
+                # os.write may write only part of the buffer; loop until done
+                data = memoryview(_DEFAULT_CONFIG_BYTES)
+                while data:
+                    written = os.write(fd, data)
+                    if written == 0:
+                        raise OSError("short write while creating config.json")
+                    data = data[written:]
+            finally:
+                os.close(fd)
+        except OSError:
+            # Never leave a truncated config behind for the next start
+            config_path.unlink()
+            raise
+
+        _say("✅ Created default config.json")
+
+# =============================================================================
+# ERROR RECOVERY SUGGESTIONS
+# =============================================================================
+
+_RECOVERY = {
+    ImportError: "• Missing Python package detected\n"
+                 "  Solution: pip install -r requirements.txt",
+    FileNotFoundError: "• Missing file detected\n"
+                       "  Solution: Ensure all core files are present",
+    PermissionError: "• Permission denied\n"
+                     "  Solution: Run with appropriate permissions",
+}
+
+_QT_RECOVERY = ("• PyQt6 issue detected\n"
+                "  Solution: pip install --upgrade PyQt6")
+
+_UNKNOWN_RECOVERY = ("• Unknown error\n"
+                     "  Please check the traceback above")
+
+
+def _recovery_suggestion(error: BaseException) -> str:
+    """Pick the recovery hint for an exception by walking its MRO"""
+    if isinstance(error, ImportError) and 'PyQt6' in (error.name or ''):
+        return _QT_RECOVERY
+    
+    for cls in type(error).__mro__:
+        suggestion = _RECOVERY.get(cls)
+        if suggestion is not None:
+            return suggestion
+    
+    if 'QT' in str(error) or 'Qt' in str(error):
+        return _QT_RECOVERY
+    
+    return _UNKNOWN_RECOVERY
 
 # =============================================================================
 # MAIN BOOTSTRAP
@@ -107,33 +208,34 @@ def main():
     Handles all bootstrap errors automatically
     """
     
-    print("="*70)
-    print("🚀 VENALLA GOD-LEVEL AI AGENT")
-    print("   Omnipotent Desktop AI with Auto-Error Rectification")
-    print("="*70)
-    print()
+    _say("="*70)
+    _say("🚀 VENALLA GOD-LEVEL AI AGENT")
+    _say("   Omnipotent Desktop AI with Auto-Error Rectification")
+    _say("="*70)
+    _say()
     
     try:
         # Step 1: Ensure dependencies
-        print("[1/4] Checking dependencies...")
+        _say("[1/4] Checking dependencies...")
         if not BootstrapErrorRectifier.ensure_dependencies():
             print("❌ Failed to install dependencies")
             print("   Please run: pip install -r requirements.txt")
             return 1
         
         # Step 2: Ensure directory structure
-        print("[2/4] Verifying directory structure...")
+        _say("[2/4] Verifying directory structure...")
         BootstrapErrorRectifier.ensure_directories()
         
         # Step 3: Ensure config
-        print("[3/4] Checking configuration...")
+        _say("[3/4] Checking configuration...")
         BootstrapErrorRectifier.ensure_config()
         
         # Step 4: Launch main window
-        print("[4/4] Launching main window...")
-        print()
+        _say("[4/4] Launching main window...")
+        _say()
         
         # Import PyQt6 after ensuring it's installed
+        from PyQt6.QtCore import QCoreApplication
         from PyQt6.QtWidgets import QApplication
         
         # Import main window
@@ -144,17 +246,19 @@ def main():
             print("   Make sure main_window.py exists in the core directory")
             return 1
         
-        # Create application
-        app = QApplication(sys.argv)
-        app.setApplicationName("Venalla AI Agent")
+        # Create application (metadata set up front; no Qt CLI flags are
+        # supported, so only the program name is handed to Qt)
+        QCoreApplication.setApplicationName("Venalla AI Agent")
+        QCoreApplication.setOrganizationName("Venalla")
+        app = QApplication(sys.argv[:1])
         
         # Create and show main window
         window = MainWindow()
         window.show()
         
-        print("✅ Venalla AI Agent launched successfully!")
-        print("   Window should now be visible")
-        print()
+        _say("✅ Venalla AI Agent launched successfully!")
+        _say("   Window should now be visible")
+        _say()
         
         # Run event loop
         return app.exec()
@@ -172,27 +276,7 @@ def main():
         print("ERROR RECOVERY SUGGESTIONS:")
         print("="*70)
         
-        error_type = type(e).__name__
-        
-        if 'ModuleNotFoundError' in error_type or 'ImportError' in error_type:
-            print("• Missing Python package detected")
-            print("  Solution: pip install -r requirements.txt")
-        
-        elif 'FileNotFoundError' in error_type:
-            print("• Missing file detected")
-            print("  Solution: Ensure all core files are present")
-        
-        elif 'PermissionError' in error_type:
-            print("• Permission denied")
-            print("  Solution: Run with appropriate permissions")
-        
-        elif 'QT' in str(e) or 'Qt' in str(e):
-            print("• PyQt6 issue detected")
-            print("  Solution: pip install --upgrade PyQt6")
-        
-        else:
-            print("• Unknown error")
-            print("  Please check the traceback above")
+        print(_recovery_suggestion(e))
         
         print("\nIf the problem persists, check:")
         print("• Python version (3.8+ required)")
@@ -3,161 +3,282 @@ VENALLA GOD-LEVEL AI AGENT - MAIN WINDOW
 Complete multi-panel UI with auto-error handling
 """
 
+import os
 import sys
-import traceback
-from pathlib import Path
-from datetime import datetime
+import time
 from typing import Optional
 
-try:
+# open_file shows a short preview; 4 KiB covers 1000 chars of most UTF-8 text
+_PREVIEW_CHARS = 1000
+_PREVIEW_READ_BYTES = 4096
+
+# Chat history kept in the view, in lines (text blocks)
+_CHAT_MAX_BLOCKS = 2000
+
+# Qt symbols are resolved on first attribute access (PEP 562) so importing
+# this module does not load the PyQt6 shared libraries.
+_QT_WIDGETS_NAMES = (
+    "QApplication", "QMainWindow", "QWidget", "QVBoxLayout", "QHBoxLayout",
+    "QTextEdit", "QLineEdit", "QPushButton", "QLabel", "QListWidget",
+    "QFileDialog", "QMessageBox", "QSplitter", "QTabWidget", "QStatusBar",
+)
+_QT_CORE_NAMES = ("Qt", "QTimer")
+
+
+def __getattr__(name):
+    if name in _QT_WIDGETS_NAMES:
+        from PyQt6 import QtWidgets
+        value = getattr(QtWidgets, name)
+    elif name in _QT_CORE_NAMES:
+        from PyQt6 import QtCore
+        value = getattr(QtCore, name)
+    elif name == "MainWindow":
+        value = _build_main_window()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+# Minimal placeholder used only while core/agent_core.py does not exist
+class _StubAgent:
+    def process_command(self, command: str) -> str:
+        return f"[AgentCore stub] Received: {command}"
+
+def _make_agent():
+    """Build the real AgentCore, or the stub if the module is absent.
+
+    Errors raised by an existing agent_core module propagate instead of
+    silently downgrading to the stub.
+    """
+    import importlib.util
+    if importlib.util.find_spec("core.agent_core") is None:
+        return _StubAgent()
+    from core.agent_core import AgentCore
+    return AgentCore()
+
+def _build_main_window():
+    """Define MainWindow on first use, paying the Qt import cost only then"""
     from PyQt6.QtWidgets import (
-        QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+        QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
         QTextEdit, QLineEdit, QPushButton, QLabel, QListWidget,
         QFileDialog, QMessageBox, QSplitter, QTabWidget, QStatusBar
     )
-    from PyQt6.QtCore import Qt, QTimer
-except Exception as e:
-    print("PyQt6 import failed. Ensure PyQt6 is installed.")
-    raise
+    from PyQt6.QtCore import (
+        Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+    )
+    from PyQt6.QtGui import QTextCursor
 
-# Minimal placeholder to avoid runtime errors if AgentCore is missing
-try:
-    from core.agent_core import AgentCore
-except Exception:
-    class AgentCore:
+    class _CommandSignals(QObject):
+        finished = pyqtSignal(str)
+
+    class _CommandWorker(QRunnable):
+        """Runs agent.process_command on a pool thread"""
+
+        def __init__(self, agent, command: str):
+            super().__init__()
+            self.agent = agent
+            self.command = command
+            # QRunnable is not a QObject; results go back through this
+            # GUI-thread object as a queued signal
+            self.signals = _CommandSignals()
+
+        def run(self):
+            try:
+                response = self.agent.process_command(self.command)
+            except Exception as e:
+                response = f"Error: {type(e).__name__}: {e}"
+            self.signals.finished.emit(response)
+
+    class MainWindow(QMainWindow):
         def __init__(self):
-            pass
-        def process_command(self, command: str) -> str:
-            return f"[AgentCore stub] Received: {command}"
-
-class MainWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Venalla God-Level AI Agent")
-        self.resize(1200, 800)
-
-        self.agent = AgentCore()
-
-        container = QWidget()
-        self.setCentralWidget(container)
-        root_layout = QVBoxLayout(container)
-
-        # Top status
-        self.status_bar = QStatusBar()
-        self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Ready - Auto-Recovery Enabled")
-
-        # Splitter for left (tabs) and right (chat)
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        root_layout.addWidget(splitter)
-
-        # Left side tabs
-        left_widget = QWidget()
-        left_layout = QVBoxLayout(left_widget)
-        self.tabs = QTabWidget()
-        left_layout.addWidget(self.tabs)
-
-        # File Explorer tab
-        self.file_list = QListWidget()
-        file_tab = QWidget()
-        file_tab_layout = QVBoxLayout(file_tab)
-        file_tab_layout.addWidget(QLabel("File Explorer"))
-        file_tab_layout.addWidget(self.file_list)
-
-        btn_row = QHBoxLayout()
-        self.btn_refresh = QPushButton("Refresh")
-        self.btn_open = QPushButton("Open")
-        self.btn_attach = QPushButton("Attach")
-        btn_row.addWidget(self.btn_refresh)
-        btn_row.addWidget(self.btn_open)
-        btn_row.addWidget(self.btn_attach)
-        file_tab_layout.addLayout(btn_row)
-        self.tabs.addTab(file_tab, "Files")
-
-        # Plugin Manager tab (placeholder)
-        plugin_tab = QWidget()
-        plugin_layout = QVBoxLayout(plugin_tab)
-        plugin_layout.addWidget(QLabel("Plugin Manager (Coming soon)"))
-        self.tabs.addTab(plugin_tab, "Plugins")
-
-        # Right side: Chat panel
-        right_widget = QWidget()
-        right_layout = QVBoxLayout(right_widget)
-
-        self.chat_view = QTextEdit()
-        self.chat_view.setReadOnly(True)
-        self.input_line = QLineEdit()
-        self.input_line.setPlaceholderText("Type a command or message…")
-        self.send_button = QPushButton("Send")
-
-        input_row = QHBoxLayout()
-        input_row.addWidget(self.input_line)
-        input_row.addWidget(self.send_button)
-
-        right_layout.addWidget(QLabel("Chat"))
-        right_layout.addWidget(self.chat_view, 1)
-        right_layout.addLayout(input_row)
-
-        splitter.addWidget(left_widget)
-        splitter.addWidget(right_widget)
-        splitter.setSizes([400, 800])
-
-        # Signals
-        self.send_button.clicked.connect(self.on_send)
-        self.input_line.returnPressed.connect(self.on_send)
-        self.btn_refresh.clicked.connect(self.refresh_files)
-        self.btn_open.clicked.connect(self.open_file)
-        self.btn_attach.clicked.connect(self.attach_file)
-
-        # Initial load
-        self.refresh_files()
-
-    def log(self, text: str):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.chat_view.append(f"[{timestamp}] {text}")
-
-    def on_send(self):
-        text = self.input_line.text().strip()
-        if not text:
-            return
-        self.log(f"You: {text}")
-        self.input_line.clear()
-        try:
-            response = self.agent.process_command(text)
-        except Exception as e:
-            response = f"Error: {type(e).__name__}: {e}"
-        self.log(f"Agent: {response}")
-
-    def refresh_files(self):
-        self.file_list.clear()
-        try:
-            cwd = Path.cwd()
-            for p in cwd.iterdir():
-                self.file_list.addItem(p.name)
+            super().__init__()
+            self.setWindowTitle("Venalla God-Level AI Agent")
+            self.resize(1200, 800)
+
+            # Created on first command, see the agent property
+            self._agent = None
+            # (epoch second, formatted "%H:%M:%S") of the last log line
+            self._ts_cache = (0, "")
+
+            container = QWidget()
+            self.setCentralWidget(container)
+            root_layout = QVBoxLayout(container)
+
+            # Top status
+            self.status_bar = QStatusBar()
+            self.setStatusBar(self.status_bar)
+            self.status_bar.showMessage("Ready - Auto-Recovery Enabled")
+
+            # Splitter for left (tabs) and right (chat)
+            splitter = QSplitter(Qt.Orientation.Horizontal)
+            root_layout.addWidget(splitter)
+
+            # Left side tabs
+            left_widget = QWidget()
+            left_layout = QVBoxLayout(left_widget)
+            self.tabs = QTabWidget()
+            left_layout.addWidget(self.tabs)
+
+            # File Explorer tab
+            self.file_list = QListWidget()
+            file_tab = QWidget()
+            file_tab_layout = QVBoxLayout(file_tab)
+            file_tab_layout.addWidget(QLabel("File Explorer"))
+            file_tab_layout.addWidget(self.file_list)
+
+            btn_row = QHBoxLayout()
+            self.btn_refresh = QPushButton("Refresh")
+            self.btn_open = QPushButton("Open")
+            self.btn_attach = QPushButton("Attach")
+            btn_row.addWidget(self.btn_refresh)
+            btn_row.addWidget(self.btn_open)
+            btn_row.addWidget(self.btn_attach)
+            file_tab_layout.addLayout(btn_row)
+            self.tabs.addTab(file_tab, "Files")
+
+            # Plugin Manager tab (placeholder)
+            plugin_tab = QWidget()
+            plugin_layout = QVBoxLayout(plugin_tab)
+            plugin_layout.addWidget(QLabel("Plugin Manager (Coming soon)"))
+            self.tabs.addTab(plugin_tab, "Plugins")
+
+            # Right side: Chat panel
+            right_widget = QWidget()
+            right_layout = QVBoxLayout(right_widget)
+
+            self.chat_view = QTextEdit()
+            self.chat_view.setReadOnly(True)
+            self.chat_view.setUndoRedoEnabled(False)
+            # Oldest lines are dropped so layout cost and memory stay bounded
+            self.chat_view.document().setMaximumBlockCount(_CHAT_MAX_BLOCKS)
+            self.input_line = QLineEdit()
+            self.input_line.setPlaceholderText("Type a command or message…")
+            self.send_button = QPushButton("Send")
+
+            input_row = QHBoxLayout()
+            input_row.addWidget(self.input_line)
+            input_row.addWidget(self.send_button)
+
+            right_layout.addWidget(QLabel("Chat"))
+            right_layout.addWidget(self.chat_view, 1)
+            right_layout.addLayout(input_row)
+
+            splitter.addWidget(left_widget)
+            splitter.addWidget(right_widget)
+            splitter.setSizes([400, 800])
+
+            # Signals
+            self.send_button.clicked.connect(self.on_send)
+            self.input_line.returnPressed.connect(self.on_send)
+            self.btn_refresh.clicked.connect(self.refresh_files)
+            self.btn_open.clicked.connect(self.open_file)
+            self.btn_attach.clicked.connect(self.attach_file)
+
+            # Initial load runs once the event loop has painted the window
+            QTimer.singleShot(0, self.refresh_files)
+
+        @property
+        def agent(self):
+            if self._agent is None:
+                self._agent = _make_agent()
+            return self._agent
+
+        def log(self, text: str):
+            # Reformat the timestamp only when the wall-clock second changes
+            now = int(time.time())
+            if now != self._ts_cache[0]:
+                from datetime import datetime
+                self._ts_cache = (now, datetime.fromtimestamp(now).strftime("%H:%M:%S"))
+            timestamp = self._ts_cache[1]
+            # Plain-text insert at the end skips append()'s rich-text parsing.
+            # A detached cursor leaves the user's selection alone, and like
+            # append() we only follow new output if already at the bottom.
+            scrollbar = self.chat_view.verticalScrollBar()
+            at_bottom = scrollbar.value() == scrollbar.maximum()
+            document = self.chat_view.document()
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(f"[{timestamp}] {text}")
+            if at_bottom:
+                scrollbar.setValue(scrollbar.maximum())
+
+        def on_send(self):
+            # One command in flight at a time
+            if not self.send_button.isEnabled():
+                return
+            text = self.input_line.text().strip()
+            if not text:
+                return
+            self.log(f"You: {text}")
+            self.input_line.clear()
+            self.send_button.setEnabled(False)
+            try:
+                worker = _CommandWorker(self.agent, text)
+            except Exception as e:
+                # Agent construction failed; report it and re-enable Send
+                self._on_result(f"Error: {type(e).__name__}: {e}")
+                return
+            worker.signals.finished.connect(self._on_result)
+            QThreadPool.globalInstance().start(worker)
+
+        @pyqtSlot(str)
+        def _on_result(self, response: str):
+            self.log(f"Agent: {response}")
+            self.send_button.setEnabled(True)
+
+        def refresh_files(self):
+            try:
+                # DirEntry.name comes straight from readdir; no Path per entry
+                with os.scandir('.') as entries:
+                    names = [e.name for e in entries]
+            except Exception as e:
+                self.file_list.clear()
+                self.status_bar.showMessage(f"File load error: {e}")
+                return
+            # Insert all rows in one call and repaint once
+            self.file_list.setUpdatesEnabled(False)
+            try:
+                self.file_list.clear()
+                self.file_list.addItems(names)
+            finally:
+                self.file_list.setUpdatesEnabled(True)
             self.status_bar.showMessage("Files refreshed")
-        except Exception as e:
-            self.status_bar.showMessage(f"File load error: {e}")
-
-    def open_file(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Open File", str(Path.cwd()))
-        if not path:
-            return
-        try:
-            content = Path(path).read_text(encoding='utf-8')
-            self.log(f"Opened {path}\n{content[:1000]}{'...' if len(content)>1000 else ''}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to open file:\n{e}")
-
-    def attach_file(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Attach File", str(Path.cwd()))
-        if not path:
-            return
-        self.log(f"Attached file: {path}")
-
-    def show_about(self):
-        QMessageBox.about(
-            self,
-            "About Venalla",
-            "Venalla God-Level AI Agent\nVersion 1.0.0\n\n"
-            "Omnipotent desktop AI with auto-error rectification",
-        )
+
+        def open_file(self):
+            from pathlib import Path
+            path, _ = QFileDialog.getOpenFileName(self, "Open File", str(Path.cwd()))
+            if not path:
+                return
+            try:
+                size = os.path.getsize(path)
+                if size == 0:
+                    self.log(f"Opened {path}\n")
+                    return
+                # Only the preview is shown, so only read that much
+                with open(path, 'rb') as f:
+                    raw = f.read(_PREVIEW_READ_BYTES)
+                content = raw.decode('utf-8', errors='replace')
+                truncated = size > len(raw) or len(content) > _PREVIEW_CHARS
+                self.log(f"Opened {path}\n{content[:_PREVIEW_CHARS]}{'...' if truncated else ''}")
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to open file:\n{e}")
+
+        def attach_file(self):
+            from pathlib import Path
+            path, _ = QFileDialog.getOpenFileName(self, "Attach File", str(Path.cwd()))
+            if not path:
+                return
+            self.log(f"Attached file: {path}")
+
+        def show_about(self):
+            QMessageBox.about(
+                self,
+                "About Venalla",
+                "Venalla God-Level AI Agent\nVersion 1.0.0\n\n"
+                "Omnipotent desktop AI with auto-error rectification",
+            )
+
+    MainWindow.__qualname__ = "MainWindow"
+    return MainWindow